@@ -1,4 +1,12 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify
+import hashlib
+import hmac
+import os
+from functools import lru_cache
+
+import orjson
+from flask import Flask, Response, render_template, request, redirect, url_for, session
+
+from calculate import simulate_own_vs_rent
 
 app = Flask(__name__)
 app.secret_key = 'SUPER-SECRET-KEY'  # Replace with something more secure in production
@@ -8,12 +16,40 @@ USERS = {
     "testuser": "testpass"
 }
 
+# Digests are computed once at import; login compares fixed-length digests
+# in constant time so response timing doesn't leak how much of a password matched.
+USER_PASSWORD_DIGESTS = {
+    username: hashlib.sha256(password.encode()).digest()
+    for username, password in USERS.items()
+}
+# Compared against when the username is unknown, so both paths do the same work
+_NO_USER_DIGEST = hashlib.sha256(b"").digest()
+
+def check_credentials(username, password):
+    expected = USER_PASSWORD_DIGESTS.get(username)
+    supplied = hashlib.sha256(password.encode()).digest()
+    password_ok = hmac.compare_digest(expected or _NO_USER_DIGEST, supplied)
+    return expected is not None and password_ok
+
+def json_response(payload, status=200):
+    """
+    Serializes payload with orjson, which is considerably faster than jsonify.
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+@lru_cache(maxsize=8)
+def render_static(template_name):
+    """
+    Renders a template that takes no context once and reuses the HTML.
+    """
+    return render_template(template_name)
+
 @app.route('/', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
-        username = request.form.get('username')
-        password = request.form.get('password')
-        if USERS.get(username) == password:
+        username = request.form.get('username', '')
+        password = request.form.get('password', '')
+        if check_credentials(username, password):
             session['logged_in'] = True
             return redirect(url_for('calculator'))
         else:
@@ -21,7 +57,7 @@ def login():
     else:
         if session.get('logged_in'):
             return redirect(url_for('calculator'))
-        return render_template('login.html')
+        return render_static('login.html')
 
 @app.route('/logout')
 def logout():
@@ -32,130 +68,30 @@ def logout():
 def calculator():
     if not session.get('logged_in'):
         return redirect(url_for('login'))
-    return render_template('calculator.html')
+    return render_static('calculator.html')
 
 @app.route('/compute', methods=['POST'])
 def compute():
     """
     AJAX endpoint that receives user inputs (via JSON),
-    then calculates renting vs. buying outcomes.
-    This version dynamically updates taxes, insurance,
-    and maintenance based on the house's changing value.
+    then calculates renting vs. buying outcomes
+    (see calculate.simulate_own_vs_rent).
     """
-    data = request.json
-
-    # User inputs
-    current_age = float(data.get('current_age', 30))
-    age_at_death = float(data.get('age_at_death', 90))
-    monthly_salary = float(data.get('monthly_salary', 5000))
-    monthly_rent = float(data.get('monthly_rent', 1500))
-    home_cost = float(data.get('home_cost', 400000))
-    down_payment = float(data.get('down_payment', 80000))
-    monthly_expenses = float(data.get('monthly_expenses', 1500))
-    investment_return = float(data.get('investment_return', 6)) / 100.0
-
-    # Time horizon
-    years = age_at_death - current_age
-    months = int(years * 12)
-
-    # Simple monthly investment rate
-    monthly_investment_rate = investment_return / 12
-
-    # ------------------
-    # Renter Scenario
-    # ------------------
-    # Start with a lump sum (down payment) in investments
-    renter_investment_balance = down_payment
-    current_monthly_salary = monthly_salary
-
-    # We won't change rent monthly here in detail,
-    # but you could add rent growth if desired.
-    # For now, keep it fixed for simplicity.
-
-    for _ in range(months):
-        leftover_rent = current_monthly_salary - (monthly_rent + monthly_expenses)
-        if leftover_rent > 0:
-            renter_investment_balance += leftover_rent
-        # Grow investment
-        renter_investment_balance *= (1 + monthly_investment_rate)
-
-        # We’ll skip monthly salary growth to keep it straightforward
-        # but you could easily incorporate that as well.
-
-    renter_net_worth = renter_investment_balance
-
-    # ------------------
-    # Buyer Scenario
-    # ------------------
-    # Mortgage logic: Very simplified example
-    principal = home_cost - down_payment
-    mortgage_rate_annual = 0.04        # 4% annual, for demonstration
-    monthly_mortgage_rate = mortgage_rate_annual / 12
-    mortgage_term_years = 30
-    num_payments = mortgage_term_years * 12
-
-    if principal > 0:
-        # Standard formula
-        monthly_mortgage_payment = (
-            principal *
-            (monthly_mortgage_rate * (1 + monthly_mortgage_rate) ** num_payments) /
-            ((1 + monthly_mortgage_rate) ** num_payments - 1)
-        )
-    else:
-        monthly_mortgage_payment = 0
-
-    # Let's assume a 1% property tax and 0.3% insurance, 0.2% maintenance, all annual,
-    # but it will scale with changing house value
-    property_tax_annual_rate = 0.01
-    insurance_annual_rate = 0.003
-    maintenance_annual_rate = 0.002
-
-    # House appreciation
-    annual_appreciation_rate = 0.02  # 2% annual
-    monthly_appreciation_rate = annual_appreciation_rate / 12
-
-    house_value = home_cost
-    buyer_investment_balance = 0
-    total_upfront = down_payment  # ignoring closing costs for simplicity here
-
-    for month_index in range(months):
-        # Each month, update the house value first
-        house_value *= (1 + monthly_appreciation_rate)
-
-        # Recalc these costs based on the updated house value
-        monthly_taxes = (house_value * property_tax_annual_rate) / 12
-        monthly_insurance = (house_value * insurance_annual_rate) / 12
-        monthly_maintenance = (house_value * maintenance_annual_rate) / 12
-
-        # If mortgage is still active
-        if month_index < num_payments:
-            monthly_costs = monthly_mortgage_payment + monthly_taxes + monthly_insurance + monthly_maintenance
-        else:
-            monthly_costs = monthly_taxes + monthly_insurance + monthly_maintenance
-
-        leftover_buy = monthly_salary - (monthly_expenses + monthly_costs)
-        if leftover_buy > 0:
-            buyer_investment_balance += leftover_buy
-
-        # Grow leftover investment
-        buyer_investment_balance *= (1 + monthly_investment_rate)
-
-    homeowner_net_worth = buyer_investment_balance + house_value
-
-    # Compare
-    difference = homeowner_net_worth - renter_net_worth
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return json_response({"error": "Request body must be valid JSON."}, 400)
+    if not isinstance(data, dict):
+        return json_response({"error": "Request body must be a JSON object."}, 400)
 
-    results = {
-        "renter_investment_balance": f"${renter_investment_balance:,.2f}",
-        "homeowner_investment_balance": f"${buyer_investment_balance:,.2f}",
-        "final_house_value": f"${house_value:,.2f}",
-        "homeowner_net_worth": f"${homeowner_net_worth:,.2f}",
-        "renter_net_worth": f"${renter_net_worth:,.2f}",
-        "difference": difference
-    }
+    try:
+        results = simulate_own_vs_rent(data)
+    except ValueError as e:
+        return json_response({"error": str(e)}, 400)
 
-    return jsonify(results)
+    return json_response(results)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0')
+    # Development server only; see wsgi.py for production. Never debug in production.
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0')
 
@@ -0,0 +1,222 @@
+import math
+from dataclasses import dataclass
+
+# Buyer assumptions. These are the same for every simulation, so the
+# derived monthly rates are computed once at import.
+
+# Mortgage logic: Very simplified example
+MORTGAGE_RATE_ANNUAL = 0.04        # 4% annual, for demonstration
+MORTGAGE_TERM_MONTHS = 30 * 12
+
+# Let's assume a 1% property tax and 0.3% insurance, 0.2% maintenance, all annual,
+# but it will scale with changing house value
+PROPERTY_TAX_ANNUAL_RATE = 0.01
+INSURANCE_ANNUAL_RATE = 0.003
+MAINTENANCE_ANNUAL_RATE = 0.002
+MONTHLY_HOME_COST_RATE = (
+    PROPERTY_TAX_ANNUAL_RATE + INSURANCE_ANNUAL_RATE + MAINTENANCE_ANNUAL_RATE
+) / 12
+
+# House appreciation
+ANNUAL_APPRECIATION_RATE = 0.02  # 2% annual
+APPRECIATION_GROWTH = 1 + ANNUAL_APPRECIATION_RATE / 12
+
+def _compound_sum(ratio, n):
+    """
+    Returns ratio + ratio**2 + ... + ratio**n, i.e. what n equal monthly
+    deposits of 1 grow to when each one compounds from the month it is made.
+    """
+    if n <= 0:
+        return 0.0
+    if ratio == 1:
+        return float(n)
+    return ratio * (ratio ** n - 1) / (ratio - 1)
+
+
+def _months_with_leftover(start, end, available, home_costs, growth):
+    """
+    Returns the run [first, last) of months start..end-1 in which
+    available - home_costs * growth ** (month + 1) is positive.
+    The amount is monotonic in the month, so the run is contiguous.
+    """
+    if available <= 0:
+        return start, start
+    if home_costs <= 0 or growth == 1:
+        return (start, end) if home_costs < available else (start, start)
+
+    # Month index at which the leftover crosses zero
+    crossing = math.log(available / home_costs) / math.log(growth) - 1
+    if growth > 1:
+        return start, min(max(math.ceil(crossing), start), end)
+    return min(max(math.floor(crossing) + 1, start), end), end
+
+
+def _run_future_value(first, last, months, available, home_costs, growth, investment_growth):
+    """
+    Future value at the end of the horizon of investing
+    available - home_costs * growth ** (t + 1) in each month t of [first, last).
+    """
+    n = last - first
+    if n <= 0:
+        return 0.0
+    return investment_growth ** (months - last) * (
+        available * _compound_sum(investment_growth, n)
+        - home_costs * growth ** (last + 1) * _compound_sum(investment_growth / growth, n)
+    )
+
+
+def calculate_mortgage_payment(principal, annual_rate, term_months):
+    """
+    Monthly payment on a fixed-rate mortgage.
+    Returns 0 when there is nothing to borrow.
+    """
+    monthly_rate = annual_rate / 12
+    if principal <= 0:
+        return 0.0
+    if monthly_rate == 0:
+        return principal / term_months
+    # Standard formula, with (1+r)^n computed once
+    pow_term = (1 + monthly_rate) ** term_months
+    return principal * monthly_rate * pow_term / (pow_term - 1)
+
+
+def _simulate_kernel(months, monthly_salary, monthly_rent, home_cost, down_payment,
+                     monthly_expenses, monthly_investment_rate):
+    """
+    Renting vs. buying simulation over the given number of months.
+    Takes only plain floats/ints so it can be compiled or vectorized later.
+    Returns (renter_investment_balance, buyer_investment_balance, house_value).
+    """
+    months = max(months, 0)
+
+    # ------------------
+    # Renter Scenario
+    # ------------------
+    # Start with a lump sum (down payment) in investments.
+    # Rent and salary are kept fixed, so the same leftover is invested every
+    # month and the balance is a geometric series with a closed form.
+    investment_growth = 1 + monthly_investment_rate
+    leftover_rent = monthly_salary - (monthly_rent + monthly_expenses)
+    renter_investment_balance = (
+        down_payment * investment_growth ** months
+        + max(leftover_rent, 0.0) * _compound_sum(investment_growth, months)
+    )
+
+    # ------------------
+    # Buyer Scenario
+    # ------------------
+    principal = home_cost - down_payment
+    monthly_mortgage_payment = calculate_mortgage_payment(
+        principal, MORTGAGE_RATE_ANNUAL, MORTGAGE_TERM_MONTHS
+    )
+
+    house_value = home_cost * APPRECIATION_GROWTH ** months
+
+    # Taxes, insurance and maintenance for month t are a fixed share of the
+    # house value that month, home_cost * APPRECIATION_GROWTH ** (t + 1).
+    monthly_home_costs = home_cost * MONTHLY_HOME_COST_RATE
+
+    # The leftover is monotonic within the mortgage and the post-mortgage
+    # phase, so each phase invests during a single run of months whose
+    # future value is a pair of geometric series.
+    mortgage_months = min(MORTGAGE_TERM_MONTHS, months)
+    buyer_investment_balance = 0.0
+    for start, end, available in (
+        (0, mortgage_months, monthly_salary - monthly_expenses - monthly_mortgage_payment),
+        (mortgage_months, months, monthly_salary - monthly_expenses),
+    ):
+        first, last = _months_with_leftover(
+            start, end, available, monthly_home_costs, APPRECIATION_GROWTH
+        )
+        buyer_investment_balance += _run_future_value(
+            first, last, months, available, monthly_home_costs,
+            APPRECIATION_GROWTH, investment_growth
+        )
+
+    return renter_investment_balance, buyer_investment_balance, house_value
+
+
+@dataclass(slots=True, frozen=True)
+class SimParams:
+    """
+    Validated /compute inputs. Ages are in years, money in dollars,
+    investment_return in percent per year.
+    """
+    current_age: float
+    age_at_death: float
+    monthly_salary: float
+    monthly_rent: float
+    home_cost: float
+    down_payment: float
+    monthly_expenses: float
+    investment_return: float
+
+
+# Accepted /compute inputs: (name, default, min, max), in SimParams field order
+PARAM_SCHEMA = (
+    ('current_age', 30, 0, 150),
+    ('age_at_death', 90, 0, 150),
+    ('monthly_salary', 5000, 0, 1_000_000_000),
+    ('monthly_rent', 1500, 0, 1_000_000_000),
+    ('home_cost', 400000, 0, 1_000_000_000_000),
+    ('down_payment', 80000, 0, 1_000_000_000_000),
+    ('monthly_expenses', 1500, 0, 1_000_000_000),
+    ('investment_return', 6, -100, 100),
+)
+
+
+def validate_params(params):
+    """
+    Reads every input in PARAM_SCHEMA from params (falling back to its
+    default) as a float and checks it is finite and within range.
+    Returns them as a SimParams; raises ValueError otherwise.
+    """
+    validated = {}
+    for name, default, min_value, max_value in PARAM_SCHEMA:
+        try:
+            value = float(params.get(name, default))
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be a number")
+        if not (math.isfinite(value) and min_value <= value <= max_value):
+            raise ValueError(f"{name} must be between {min_value:,} and {max_value:,}")
+        validated[name] = value
+    return SimParams(**validated)
+
+
+def simulate_own_vs_rent(params):
+    """
+    Calculates renting vs. buying outcomes for the given user inputs
+    (a dict, as posted to /compute). Taxes, insurance, and maintenance
+    follow the house's changing value. Raises ValueError on invalid input.
+    """
+
+    # User inputs
+    p = validate_params(params)
+    investment_return = p.investment_return / 100.0
+
+    # Time horizon
+    years = p.age_at_death - p.current_age
+    months = int(years * 12)
+
+    # Simple monthly investment rate
+    monthly_investment_rate = investment_return / 12
+
+    renter_investment_balance, buyer_investment_balance, house_value = _simulate_kernel(
+        months, p.monthly_salary, p.monthly_rent, p.home_cost, p.down_payment,
+        p.monthly_expenses, monthly_investment_rate
+    )
+
+    renter_net_worth = renter_investment_balance
+    homeowner_net_worth = buyer_investment_balance + house_value
+
+    # Compare
+    difference = homeowner_net_worth - renter_net_worth
+
+    return {
+        "renter_investment_balance": renter_investment_balance,
+        "homeowner_investment_balance": buyer_investment_balance,
+        "final_house_value": house_value,
+        "homeowner_net_worth": homeowner_net_worth,
+        "renter_net_worth": renter_net_worth,
+        "difference": difference
+    }
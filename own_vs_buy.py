@@ -1,3 +1,6 @@
+import math
+
+
 def main():
     """
     Compare lifetime cost of home ownership vs. renting+investing.
@@ -37,7 +40,9 @@ def main():
 
     # 2. Calculate total months for the simulation
     total_years = AGE_AT_DEATH - CURRENT_AGE
-    total_months = total_years * 12
+    # A horizon that has already passed simulates no time at all
+    horizon_years = max(total_years, 0)
+    total_months = horizon_years * 12
 
     # 3. Mortgage Payment Calculation (Monthly)
     #    Formula: M = P * (r(1+r)^n) / ((1+r)^n - 1)
@@ -50,11 +55,9 @@ def main():
     number_of_payments = MORTGAGE_TERM_YEARS * 12
 
     if principal > 0:
-        monthly_mortgage_payment = (
-            principal *
-            (monthly_interest_rate * (1 + monthly_interest_rate) ** number_of_payments) /
-            ((1 + monthly_interest_rate) ** number_of_payments - 1)
-        )
+        # (1+r)^n appears twice in the formula; compute it once
+        pow_term = (1 + monthly_interest_rate) ** number_of_payments
+        monthly_mortgage_payment = principal * monthly_interest_rate * pow_term / (pow_term - 1)
     else:
         # If DOWN_PAYMENT >= HOME_COST, no mortgage needed
         monthly_mortgage_payment = 0
@@ -64,64 +67,80 @@ def main():
     monthly_insurance = HOME_INSURANCE_PER_YEAR / 12
     monthly_maintenance = AVERAGE_YEARLY_MAINTENANCE / 12
 
-    # 5. Initialize tracking variables
+    # Monthly ownership cost while the mortgage is being paid, and after:
+    # once it is paid off, only taxes, insurance, and maintenance remain
+    owner_cost_with_mortgage = (monthly_mortgage_payment +
+                                monthly_property_tax +
+                                monthly_insurance +
+                                monthly_maintenance)
+    owner_cost_after_mortgage = (monthly_property_tax +
+                                 monthly_insurance +
+                                 monthly_maintenance)
+    mortgage_years = min(MORTGAGE_TERM_YEARS, horizon_years)
 
-    # For the homeowner:
-    # Start with the home’s initial value; it will appreciate monthly
-    house_value = HOME_COST  
-    total_ownership_cost = DOWN_PAYMENT + BUYER_CLOSING_COSTS  # upfront out-of-pocket
-    
-    # For the renter:
-    # Lump sum investment is the down payment + closing costs that aren't spent on buying.
-    investment_balance = DOWN_PAYMENT + BUYER_CLOSING_COSTS
-    total_renting_cost = 0.0
-    
     # Convert annual appreciation to a monthly factor
-    monthly_appreciation_rate = (1 + HOME_APPRECIATION_PERCENT) ** (1/12) - 1
+    monthly_appreciation_rate = math.expm1(math.log1p(HOME_APPRECIATION_PERCENT) / 12)
     
     # Convert annual investment return to monthly
     monthly_investment_return_rate = INVESTMENT_RETURN_PERCENT / 12
 
-    current_rent = RENT_PER_MONTH
+    # Monthly growth factors
+    monthly_appreciation_factor = 1 + monthly_appreciation_rate
+    monthly_investment_factor = 1 + monthly_investment_return_rate
+
+    # 5. Totals in closed form.
+    #    Costs are constant within each year and rent grows once a year, so
+    #    the totals over the whole period are plain (geometric) sums.
 
-    # 6. Iterate month by month
-    for month in range(1, total_months + 1):
-        # House appreciates each month (can be negative if it's depreciation)
-        house_value *= (1 + monthly_appreciation_rate)
+    # For the homeowner:
+    # The home's initial value appreciates monthly
+    house_value = HOME_COST * monthly_appreciation_factor ** total_months
+    total_ownership_cost = (DOWN_PAYMENT + BUYER_CLOSING_COSTS +  # upfront out-of-pocket
+                            12 * mortgage_years * owner_cost_with_mortgage +
+                            12 * (horizon_years - mortgage_years) * owner_cost_after_mortgage)
+
+    # For the renter:
+    # 12 months at RENT_PER_MONTH * (1 + g)^year for each year
+    if RENT_ANNUAL_GROWTH_RATE != 0:
+        total_renting_cost = (12 * RENT_PER_MONTH * ((1 + RENT_ANNUAL_GROWTH_RATE) ** horizon_years - 1) /
+                              RENT_ANNUAL_GROWTH_RATE)
+    else:
+        total_renting_cost = 12 * RENT_PER_MONTH * horizon_years
+
+    # Within a year every month adds the same amount and then grows, so 12 months
+    # collapse to: balance * g^12 + amount * (g + g^2 + ... + g^12)
+    yearly_investment_factor = monthly_investment_factor ** 12
+    if monthly_investment_factor != 1:
+        yearly_contribution_factor = (monthly_investment_factor * (yearly_investment_factor - 1) /
+                                      (monthly_investment_factor - 1))
+    else:
+        yearly_contribution_factor = 12.0
 
-        # Calculate monthly ownership cost
-        if month <= number_of_payments:
+    # Lump sum investment is the down payment + closing costs that aren't spent on buying.
+    investment_balance = DOWN_PAYMENT + BUYER_CLOSING_COSTS
+    current_rent = RENT_PER_MONTH
+
+    # 6. Iterate year by year for the renter's investments.
+    #    Only invested months count, so this one still needs a loop; the
+    #    mortgage term is a whole number of years, so each year uses one cost.
+    for year in range(horizon_years):
+        if year < mortgage_years:
             # Mortgage not fully paid yet
-            monthly_owner_cost = (monthly_mortgage_payment +
-                                  monthly_property_tax +
-                                  monthly_insurance +
-                                  monthly_maintenance)
+            monthly_owner_cost = owner_cost_with_mortgage
         else:
-            # After the mortgage is paid off, only taxes, insurance, and maintenance remain
-            monthly_owner_cost = (monthly_property_tax +
-                                  monthly_insurance +
-                                  monthly_maintenance)
-        
-        # Add to total ownership cost
-        total_ownership_cost += monthly_owner_cost
-
-        # Renter pays this month’s rent
-        total_renting_cost += current_rent
+            monthly_owner_cost = owner_cost_after_mortgage
 
         # Determine leftover that the renter invests if renting is cheaper
         # difference > 0 => owning is more expensive => that difference can be invested by the renter
         difference = monthly_owner_cost - current_rent
-        
-        if difference > 0:
-            # This means renting is cheaper by 'difference'
-            investment_balance += difference  # invest that difference immediately
 
-        # Grow the investment balance by the monthly return
-        investment_balance *= (1 + monthly_investment_return_rate)
+        # Grow the investment balance by the monthly return, investing the
+        # difference at the start of each month if renting is cheaper
+        investment_balance = (investment_balance * yearly_investment_factor +
+                              max(difference, 0.0) * yearly_contribution_factor)
 
         # Increase rent once a year
-        if month % 12 == 0:
-            current_rent *= (1 + RENT_ANNUAL_GROWTH_RATE)
+        current_rent *= (1 + RENT_ANNUAL_GROWTH_RATE)
 
     # 7. Final net worth calculations
     # Homeowner's final net worth (simplified):
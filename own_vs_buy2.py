@@ -1,240 +1,372 @@
-def main():
+import argparse
+import json
+import math
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
+
+
+@dataclass(frozen=True)
+class Params:
     """
-    1. Prints assumption values.
-    2. Calculates monthly living expenses (inflation-adjusted) for groceries, travel, schooling, healthcare, incidentals.
-    3. Calculates renting vs buying costs each month (both in terms of cash flow and net worth).
-    4. Compares the final net worth of renting vs buying, color-codes the final statement to indicate which is better.
+    All assumptions for one renting vs. buying comparison.
+    The defaults are the standard scenario printed by main() (DEFAULT_PARAMS).
     """
 
-    # ANSI color codes for terminal output
-    COLOR_GREEN = "\033[92m"
-    COLOR_RED = "\033[91m"
-    COLOR_RESET = "\033[0m"
-    COLOR_YELLOW = "\033[93m"  # optional for neutral or headings
-
-    # ================
-    # Part 1: Constants
-    # ================
-
     # Time horizon
-    CURRENT_AGE = 35
-    AGE_AT_DEATH = 90
-    total_years = AGE_AT_DEATH - CURRENT_AGE
-    total_months = total_years * 12
+    current_age: int = 35
+    age_at_death: int = 90
 
     # --- Income & Growth ---
-    MONTHLY_SALARY = 10000.0          # Initial monthly salary
-    ANNUAL_SALARY_GROWTH = 0.02      # 2% annual salary increase
+    monthly_salary: float = 10000.0         # Initial monthly salary
+    annual_salary_growth: float = 0.02      # 2% annual salary increase
 
     # --- Inflation for Monthly Expenses ---
-    ANNUAL_INFLATION = 0.03          # 3% annual
+    annual_inflation: float = 0.03          # 3% annual
 
     # --- Base Monthly Expenses (excluding accommodation) ---
-    BASE_GROCERIES = 500.0
-    BASE_TRAVEL = 200.0
-    BASE_SCHOOLING = 300.0
-    BASE_HEALTHCARE = 400.0
-    BASE_INCIDENTALS = 2500.0        # "catch-all" category
+    base_groceries: float = 500.0
+    base_travel: float = 200.0
+    base_schooling: float = 300.0
+    base_healthcare: float = 400.0
+    base_incidentals: float = 2500.0        # "catch-all" category
 
     # --- Investment Growth ---
-    ANNUAL_INVESTMENT_RETURN = 0.07  # 7% annual
+    annual_investment_return: float = 0.07  # 7% annual
 
     # --- Renting Details ---
-    RENT_PER_MONTH = 2000.0
-    ANNUAL_RENT_GROWTH = 0.025       # 2.5% annual
+    rent_per_month: float = 2000.0
+    annual_rent_growth: float = 0.025       # 2.5% annual
 
     # --- Buying Details ---
-    HOME_COST = 350_000.0
-    DOWN_PAYMENT = 80_000.0
-    BUYER_CLOSING_COSTS = 5_000.0
+    home_cost: float = 350_000.0
+    down_payment: float = 80_000.0
+    buyer_closing_costs: float = 5_000.0
 
-    MORTGAGE_RATE = 0.04             # 4% annual
-    MORTGAGE_TERM_YEARS = 30
-    PROPERTY_TAX_RATE = 0.01         # 1% of home value per year
-    HOME_INSURANCE_PER_YEAR = 1200.0
-    AVERAGE_YEARLY_MAINTENANCE = 5000.0
+    mortgage_rate: float = 0.04             # 4% annual
+    mortgage_term_years: int = 30
+    property_tax_rate: float = 0.01         # 1% of home value per year
+    home_insurance_per_year: float = 1200.0
+    average_yearly_maintenance: float = 5000.0
 
     # Home appreciation (positive or negative)
-    ANNUAL_HOME_APPRECIATION = 0.05  # 5% per year
+    annual_home_appreciation: float = 0.05  # 5% per year
+
+    @property
+    def total_years(self):
+        return self.age_at_death - self.current_age
+
+    @property
+    def base_standard_expenses(self):
+        return math.fsum((
+            self.base_groceries,
+            self.base_travel,
+            self.base_schooling,
+            self.base_healthcare,
+            self.base_incidentals,
+        ))
+
+
+class Result(NamedTuple):
+    """
+    Totals and final balances of one simulation.
+    """
+    total_income: float
+    total_standard_expenses: float
+    total_rent_cost: float
+    total_buy_cost: float
+    rent_investment_balance: float
+    buy_investment_balance: float
+    house_value: float
+
+    @property
+    def rent_net_worth(self):
+        # Renter's net worth: final investment balance
+        return self.rent_investment_balance
+
+    @property
+    def buy_net_worth(self):
+        # Owner's net worth: final investment balance + house value
+        return self.buy_investment_balance + self.house_value
+
+
+# The scenario main() reports; built once at import
+DEFAULT_PARAMS = Params()
+
+
+def geometric_total(first, monthly_growth, months):
+    """
+    Total of a monthly amount that starts at `first` and grows by `monthly_growth`
+    each month, over `months` months: first * ((1 + g)^n - 1) / g.
+    """
+    if monthly_growth == 0:
+        return first * months
+    return first * math.expm1(months * math.log1p(monthly_growth)) / monthly_growth
+
+
+def _m(value):
+    """
+    Formats a dollar amount for the report, e.g. $1,234.56.
+    """
+    return f"${value:,.2f}"
 
-    # ================
-    # Display Assumptions
-    # ================
-    print(f"{COLOR_YELLOW}----- Assumptions -----{COLOR_RESET}")
-    print(f"Time Span: {CURRENT_AGE} to {AGE_AT_DEATH} (Total {total_years} years)")
-    print(f"Initial Monthly Salary: ${MONTHLY_SALARY:,.2f}")
-    print(f"Annual Salary Growth: {ANNUAL_SALARY_GROWTH*100:.2f}%")
-    print(f"Annual Inflation (non-housing expenses): {ANNUAL_INFLATION*100:.2f}%")
-    print(f"Base Monthly Expenses (Groceries + Travel + Schooling + Healthcare + Incidentals): "
-          f"${(BASE_GROCERIES + BASE_TRAVEL + BASE_SCHOOLING + BASE_HEALTHCARE + BASE_INCIDENTALS):,.2f}")
-    print(f"Annual Investment Return: {ANNUAL_INVESTMENT_RETURN*100:.2f}%\n")
-
-    print("Renting Assumptions:")
-    print(f" - Initial Monthly Rent: ${RENT_PER_MONTH:,.2f}")
-    print(f" - Annual Rent Growth: {ANNUAL_RENT_GROWTH*100:.2f}%\n")
-
-    print("Buying Assumptions:")
-    print(f" - Home Cost: ${HOME_COST:,.2f}")
-    print(f" - Down Payment: ${DOWN_PAYMENT:,.2f}")
-    print(f" - Buyer Closing Costs: ${BUYER_CLOSING_COSTS:,.2f}")
-    print(f" - Mortgage Rate (Annual): {MORTGAGE_RATE*100:.2f}%")
-    print(f" - Mortgage Term: {MORTGAGE_TERM_YEARS} years")
-    print(f" - Property Tax Rate: {PROPERTY_TAX_RATE*100:.2f}% of home value/year")
-    print(f" - Home Insurance/Year: ${HOME_INSURANCE_PER_YEAR:,.2f}")
-    print(f" - Avg Yearly Maintenance: ${AVERAGE_YEARLY_MAINTENANCE:,.2f}")
-    print(f" - Annual Home Appreciation: {ANNUAL_HOME_APPRECIATION*100:.2f}%")
-    print(f"{'-'*50}\n")
+
+def mortgage_payment(principal, monthly_rate, number_of_payments):
+    """
+    Monthly payment on a fixed-rate mortgage, or 0 when nothing is borrowed
+    or there are no payments to make.
+    """
+    if principal <= 0 or number_of_payments <= 0:
+        return 0.0
+    if monthly_rate == 0:
+        return principal / number_of_payments
+    # (1+r)^n appears twice in the formula; compute it once
+    pow_n = math.pow(1.0 + monthly_rate, number_of_payments)
+    return principal * monthly_rate * pow_n / (pow_n - 1.0)
+
+
+@lru_cache(maxsize=4096)
+def simulate(p: Params) -> Result:
+    """
+    Calculates renting vs buying month by month for the given assumptions:
+    living expenses grow with inflation, and whatever is left of the salary
+    after expenses and housing is invested in each scenario.
+    Params is frozen and Result immutable, so results are cached per Params.
+    """
+    # A horizon that has already passed simulates no months
+    total_months = max(p.total_years * 12, 0)
 
     # ================
-    # Part 2: Derive Monthly Rates and Setup
+    # Derive Monthly Rates and Setup
     # ================
-    monthly_salary_growth = (1 + ANNUAL_SALARY_GROWTH) ** (1/12) - 1
-    monthly_inflation = (1 + ANNUAL_INFLATION) ** (1/12) - 1
-    monthly_investment_growth = ANNUAL_INVESTMENT_RETURN / 12
-    monthly_rent_growth = (1 + ANNUAL_RENT_GROWTH) ** (1/12) - 1
-    monthly_home_appreciation = (1 + ANNUAL_HOME_APPRECIATION) ** (1/12) - 1
+    # expm1(log1p(x) / 12) == (1 + x) ** (1/12) - 1, without the rounding loss for small x
+    monthly_salary_growth = math.expm1(math.log1p(p.annual_salary_growth) / 12)
+    monthly_inflation = math.expm1(math.log1p(p.annual_inflation) / 12)
+    monthly_investment_growth = p.annual_investment_return / 12
+    monthly_rent_growth = math.expm1(math.log1p(p.annual_rent_growth) / 12)
+    monthly_home_appreciation = math.expm1(math.log1p(p.annual_home_appreciation) / 12)
 
     # Base standard expenses total
-    base_standard_expenses = (
-        BASE_GROCERIES +
-        BASE_TRAVEL +
-        BASE_SCHOOLING +
-        BASE_HEALTHCARE +
-        BASE_INCIDENTALS
-    )
+    base_standard_expenses = p.base_standard_expenses
     current_standard_expenses = base_standard_expenses
 
     # Mortgage payment
-    principal = HOME_COST - DOWN_PAYMENT
-    monthly_mortgage_rate = MORTGAGE_RATE / 12
-    number_of_payments = MORTGAGE_TERM_YEARS * 12
-
-    if principal > 0:
-        monthly_mortgage_payment = (
-            principal *
-            (monthly_mortgage_rate * (1 + monthly_mortgage_rate) ** number_of_payments) /
-            ((1 + monthly_mortgage_rate) ** number_of_payments - 1)
-        )
-    else:
-        monthly_mortgage_payment = 0.0
+    principal = p.home_cost - p.down_payment
+    monthly_mortgage_rate = p.mortgage_rate / 12
+    number_of_payments = max(p.mortgage_term_years * 12, 0)
+
+    monthly_mortgage_payment = mortgage_payment(principal, monthly_mortgage_rate, number_of_payments)
 
-    # Convert your annual property tax, insurance, and maintenance to percentage rates relative to HOME_COST:
+    # Convert your annual property tax, insurance, and maintenance to percentage rates relative to home_cost:
     # We'll do this so we can recalculate them each month based on the new house_value.
-    property_tax_annual_rate = PROPERTY_TAX_RATE  # e.g., 0.01
-    insurance_annual_rate = HOME_INSURANCE_PER_YEAR / HOME_COST  # e.g., 1200 / 350000
-    maintenance_annual_rate = AVERAGE_YEARLY_MAINTENANCE / HOME_COST  # e.g., 5000 / 350000
+    property_tax_annual_rate = p.property_tax_rate  # e.g., 0.01
+    insurance_annual_rate = p.home_insurance_per_year / p.home_cost  # e.g., 1200 / 350000
+    maintenance_annual_rate = p.average_yearly_maintenance / p.home_cost  # e.g., 5000 / 350000
+
+    # Loop-invariant monthly factors, computed once instead of every month
+    monthly_invest_factor = 1 + monthly_investment_growth
+    monthly_home_factor = 1 + monthly_home_appreciation
+    monthly_salary_factor = 1 + monthly_salary_growth
+    monthly_rent_factor = 1 + monthly_rent_growth
+    monthly_inflation_factor = 1 + monthly_inflation
+    monthly_property_tax_factor = property_tax_annual_rate / 12
+    monthly_insurance_factor = insurance_annual_rate / 12
+    monthly_maintenance_factor = maintenance_annual_rate / 12
+
+    # Taxes, insurance, and maintenance are all a fixed share of the house value,
+    # so their monthly sum is one factor of it
+    monthly_home_cost_factor = (
+        monthly_property_tax_factor + monthly_insurance_factor + monthly_maintenance_factor
+    )
 
     # ================
-    # Part 3: Tracking & Simulation
+    # Tracking & Simulation
     # ================
-    total_income = 0.0
-    total_standard_expenses_accum = 0.0
+    # Salary, standard expenses, and rent each grow at a fixed monthly rate,
+    # so their totals over the whole period are closed-form geometric sums
+    total_income = geometric_total(p.monthly_salary, monthly_salary_growth, total_months)
+    total_standard_expenses_accum = geometric_total(base_standard_expenses, monthly_inflation, total_months)
+    total_rent_cost = geometric_total(p.rent_per_month, monthly_rent_growth, total_months)
 
     # Renting scenario
-    total_rent_cost = 0.0
-    rent_investment_balance = DOWN_PAYMENT + BUYER_CLOSING_COSTS  # Freed up capital if you don't buy
-    current_rent = RENT_PER_MONTH
+    upfront_capital = p.down_payment + p.buyer_closing_costs  # Freed up capital if you don't buy
+    # The loop only tracks the invested leftovers; the upfront capital just
+    # compounds every month, so it is added in closed form after the loop
+    rent_investment_balance = 0.0
+    current_rent = p.rent_per_month
 
     # Buying scenario
-    total_buy_cost = DOWN_PAYMENT + BUYER_CLOSING_COSTS  # upfront cost
+    # The mortgage is only paid for the months of the horizon it covers
+    mortgage_months = min(number_of_payments, total_months)
+
+    # Upfront cost, the mortgage payments, and taxes, insurance, and maintenance,
+    # which track a house value growing by a fixed monthly rate.
+    # fsum keeps the total correctly rounded whatever order the parts come in
+    total_buy_cost = math.fsum((
+        p.down_payment,
+        p.buyer_closing_costs,
+        monthly_mortgage_payment * mortgage_months,
+        geometric_total(
+            p.home_cost * monthly_home_factor * monthly_home_cost_factor,
+            monthly_home_appreciation,
+            total_months,
+        ),
+    ))
     buy_investment_balance = 0.0
-    house_value = HOME_COST
+    house_value = p.home_cost * monthly_home_factor ** total_months
+    monthly_home_costs = p.home_cost * monthly_home_cost_factor
 
     # Starting salary
-    current_monthly_salary = MONTHLY_SALARY
-
-    for month in range(1, total_months + 1):
-        # --- Income
-        total_income += current_monthly_salary
-
-        # --- Standard Expenses (inflation-adjusted)
-        total_standard_expenses_accum += current_standard_expenses
-
-        # --- Renting: Pay Rent, Invest Leftover
-        total_rent_cost += current_rent
-        leftover_rent = current_monthly_salary - current_standard_expenses - current_rent
-        if leftover_rent > 0:
-            rent_investment_balance += leftover_rent
-        rent_investment_balance *= (1 + monthly_investment_growth)
-
-        # --- Buying: Update House Value, then compute monthly taxes, insurance, maintenance
-        house_value *= (1 + monthly_home_appreciation)
-
-        # Recalc monthly property tax, insurance, maintenance based on current house_value
-        dynamic_monthly_property_tax = (house_value * property_tax_annual_rate) / 12
-        dynamic_monthly_insurance = (house_value * insurance_annual_rate) / 12
-        dynamic_monthly_maintenance = (house_value * maintenance_annual_rate) / 12
-
-        if month <= number_of_payments:
-            monthly_ownership_cost = (
-                monthly_mortgage_payment +
-                dynamic_monthly_property_tax +
-                dynamic_monthly_insurance +
-                dynamic_monthly_maintenance
-            )
-        else:
-            monthly_ownership_cost = (
-                dynamic_monthly_property_tax +
-                dynamic_monthly_insurance +
-                dynamic_monthly_maintenance
-            )
-
-        total_buy_cost += monthly_ownership_cost
-
-        leftover_buy = current_monthly_salary - current_standard_expenses - monthly_ownership_cost
-        if leftover_buy > 0:
-            buy_investment_balance += leftover_buy
-        buy_investment_balance *= (1 + monthly_investment_growth)
-
-        # --- Increase Salary, Rent, Standard Expenses (monthly growth)
-        current_monthly_salary *= (1 + monthly_salary_growth)
-        current_rent *= (1 + monthly_rent_growth)
-        current_standard_expenses *= (1 + monthly_inflation)
+    current_monthly_salary = p.monthly_salary
+
+    # The mortgage is paid for the first mortgage_months months only, so the
+    # months run in two phases with a fixed mortgage cost each, instead of
+    # testing the month against number_of_payments on every iteration
+    for phase_months, mortgage_cost in (
+        (mortgage_months, monthly_mortgage_payment),
+        (total_months - mortgage_months, 0.0),
+    ):
+        for _ in range(phase_months):
+            # --- Renting: Pay Rent, Invest Leftover
+            leftover_rent = current_monthly_salary - current_standard_expenses - current_rent
+            rent_investment_balance = (rent_investment_balance + max(leftover_rent, 0.0)) * monthly_invest_factor
+
+            # --- Buying: the house appreciates, and its taxes, insurance, and maintenance with it
+            monthly_home_costs *= monthly_home_factor
+            monthly_ownership_cost = monthly_home_costs + mortgage_cost
+
+            leftover_buy = current_monthly_salary - current_standard_expenses - monthly_ownership_cost
+            buy_investment_balance = (buy_investment_balance + max(leftover_buy, 0.0)) * monthly_invest_factor
+
+            # --- Increase Salary, Rent, Standard Expenses (monthly growth)
+            current_monthly_salary *= monthly_salary_factor
+            current_rent *= monthly_rent_factor
+            current_standard_expenses *= monthly_inflation_factor
+
+    rent_investment_balance += upfront_capital * monthly_invest_factor ** total_months
+
+    return Result(
+        total_income=total_income,
+        total_standard_expenses=total_standard_expenses_accum,
+        total_rent_cost=total_rent_cost,
+        total_buy_cost=total_buy_cost,
+        rent_investment_balance=rent_investment_balance,
+        buy_investment_balance=buy_investment_balance,
+        house_value=house_value,
+    )
+
+
+def main(argv=None):
+    """
+    With --json, writes the simulation results as a single JSON object instead of the report below.
+
+    1. Reports assumption values.
+    2. Simulates renting vs buying for DEFAULT_PARAMS (see simulate).
+    3. Compares the final net worth of renting vs buying, color-codes the final statement to indicate which is better.
+    4. Writes the whole report to stdout at once.
+    """
 
+    parser = argparse.ArgumentParser(description="Compare renting vs buying a home over a lifetime.")
+    parser.add_argument("--json", action="store_true",
+                        help="write the results as one JSON object instead of the report")
+    args = parser.parse_args(argv)
+
+    p = DEFAULT_PARAMS
+
+    if args.json:
+        r = simulate(p)
+        results = r._asdict()
+        results["rent_net_worth"] = r.rent_net_worth
+        results["buy_net_worth"] = r.buy_net_worth
+        results["difference"] = r.buy_net_worth - r.rent_net_worth
+        sys.stdout.write(json.dumps(results) + "\n")
+        return
+
+    # ANSI color codes for terminal output, left out when stdout is
+    # redirected or NO_COLOR is set (https://no-color.org)
+    use_color = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+    COLOR_GREEN = "\033[92m" if use_color else ""
+    COLOR_RED = "\033[91m" if use_color else ""
+    COLOR_RESET = "\033[0m" if use_color else ""
+    COLOR_YELLOW = "\033[93m" if use_color else ""  # optional for neutral or headings
+
+    # ================
+    # Display Assumptions
     # ================
-    # Part 4: Final Output & Comparison
+    # All output is collected here and written in one go at the end
+    report = []
+    report.append(f"{COLOR_YELLOW}----- Assumptions -----{COLOR_RESET}")
+    report.append(f"Time Span: {p.current_age} to {p.age_at_death} (Total {p.total_years} years)")
+    report.append(f"Initial Monthly Salary: {_m(p.monthly_salary)}")
+    report.append(f"Annual Salary Growth: {p.annual_salary_growth*100:.2f}%")
+    report.append(f"Annual Inflation (non-housing expenses): {p.annual_inflation*100:.2f}%")
+    report.append(f"Base Monthly Expenses (Groceries + Travel + Schooling + Healthcare + Incidentals): "
+                  f"{_m(p.base_standard_expenses)}")
+    report.append(f"Annual Investment Return: {p.annual_investment_return*100:.2f}%\n")
+
+    report.append("Renting Assumptions:")
+    report.append(f" - Initial Monthly Rent: {_m(p.rent_per_month)}")
+    report.append(f" - Annual Rent Growth: {p.annual_rent_growth*100:.2f}%\n")
+
+    report.append("Buying Assumptions:")
+    report.append(f" - Home Cost: {_m(p.home_cost)}")
+    report.append(f" - Down Payment: {_m(p.down_payment)}")
+    report.append(f" - Buyer Closing Costs: {_m(p.buyer_closing_costs)}")
+    report.append(f" - Mortgage Rate (Annual): {p.mortgage_rate*100:.2f}%")
+    report.append(f" - Mortgage Term: {p.mortgage_term_years} years")
+    report.append(f" - Property Tax Rate: {p.property_tax_rate*100:.2f}% of home value/year")
+    report.append(f" - Home Insurance/Year: {_m(p.home_insurance_per_year)}")
+    report.append(f" - Avg Yearly Maintenance: {_m(p.average_yearly_maintenance)}")
+    report.append(f" - Annual Home Appreciation: {p.annual_home_appreciation*100:.2f}%")
+    report.append(f"{'-'*50}\n")
+
+    r = simulate(p)
+
+    # ================
+    # Final Output & Comparison
     # ================
-    print(f"{COLOR_YELLOW}----- Final Results -----{COLOR_RESET}")
-    print(f"Total Income (All Sources):           ${total_income:,.2f}")
-    print(f"Total Standard Expenses (Excl. Accommodation): ${total_standard_expenses_accum:,.2f}")
+    report.append(f"{COLOR_YELLOW}----- Final Results -----{COLOR_RESET}")
+    report.append(f"Total Income (All Sources):           {_m(r.total_income)}")
+    report.append(f"Total Standard Expenses (Excl. Accommodation): {_m(r.total_standard_expenses)}")
 
     # Costs including renting
-    total_rent_incl_expenses = total_standard_expenses_accum + total_rent_cost
-    print(f"Total Costs (Incl. Rent):            ${total_rent_incl_expenses:,.2f}")
+    total_rent_incl_expenses = r.total_standard_expenses + r.total_rent_cost
+    report.append(f"Total Costs (Incl. Rent):            {_m(total_rent_incl_expenses)}")
 
     # Costs including buying
-    total_buy_incl_expenses = total_standard_expenses_accum + total_buy_cost
-    print(f"Total Costs (Incl. Buy):             ${total_buy_incl_expenses:,.2f}\n")
+    total_buy_incl_expenses = r.total_standard_expenses + r.total_buy_cost
+    report.append(f"Total Costs (Incl. Buy):             {_m(total_buy_incl_expenses)}\n")
 
     # Compute a simplified 'final net worth' approach
-    # - Renter's net worth: final investment balance
-    # - Owner's net worth: final investment balance + house value
-    rent_net_worth = rent_investment_balance
-    buy_net_worth = buy_investment_balance + house_value
+    rent_net_worth = r.rent_net_worth
+    buy_net_worth = r.buy_net_worth
 
-    print(f"Renter's Final Investment Balance:    ${rent_net_worth:,.2f}")
-    print(f"Homeowner's Investment Balance:       ${buy_investment_balance:,.2f}")
-    print(f"Final House Value:                    ${house_value:,.2f}")
+    report.append(f"Renter's Final Investment Balance:    {_m(rent_net_worth)}")
+    report.append(f"Homeowner's Investment Balance:       {_m(r.buy_investment_balance)}")
+    report.append(f"Final House Value:                    {_m(r.house_value)}")
 
-    print()
+    report.append("")
     difference = buy_net_worth - rent_net_worth
     if difference > 0:
         # Buying scenario is ahead
-        print(
-            f"{COLOR_GREEN}Buying is ahead by ${difference:,.2f} "
+        verdict = (
+            f"{COLOR_GREEN}Buying is ahead by {_m(difference)} "
             f"({buy_net_worth:,.2f} vs. {rent_net_worth:,.2f}){COLOR_RESET}"
         )
     elif difference < 0:
         # Renting scenario is ahead
-        print(
-            f"{COLOR_GREEN}Renting is ahead by ${abs(difference):,.2f} "
+        verdict = (
+            f"{COLOR_GREEN}Renting is ahead by {_m(abs(difference))} "
             f"({rent_net_worth:,.2f} vs. {buy_net_worth:,.2f}){COLOR_RESET}"
         )
     else:
         # Exactly the same (unlikely in real life)
-        print(f"{COLOR_YELLOW}Both scenarios come out exactly the same!{COLOR_RESET}")
+        verdict = f"{COLOR_YELLOW}Both scenarios come out exactly the same!{COLOR_RESET}"
+    report.append(verdict)
 
+    sys.stdout.write("\n".join(report) + "\n")
 
 if __name__ == "__main__":
     main()
-
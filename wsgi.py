@@ -0,0 +1,9 @@
+"""
+WSGI entry point for running the calculator under a production server, e.g.
+
+    gunicorn -w 8 -k sync --preload --timeout 30 wsgi:app
+
+--preload imports the app once in the master so workers share the
+loaded code and templates copy-on-write.
+"""
+from app import app